@@ -1,8 +1,11 @@
-from flask import Flask, request, jsonify, render_template
+from flask import Flask, Response, request, jsonify, render_template
 from flask_socketio import SocketIO
-from data_store import update_data, get_data, get_latest_per_id
+from data_store import update_data, get_data, get_latest_per_id, iter_messages
 import threading
 import json
+import csv
+import io
+import zlib
 import time
 import paho.mqtt.client as mqtt
 import logging
@@ -23,6 +26,11 @@ except ImportError:
 MQTT_BROKER = os.getenv("MQTT_BROKER", "mqtt-broker")
 MQTT_PORT = int(os.getenv("MQTT_PORT", 1883))
 MQTT_TOPIC = "can/messages"
+EXPORT_MAX_ROWS = int(os.getenv("EXPORT_MAX_ROWS", 100000))
+EXPORT_CHUNK_ROWS = 500
+
+# Same columns as can_reader's log_to_csv, so exports and logs line up
+EXPORT_FIELDS = ["timestamp", "can_id", "is_extended", "payload"]
 
 # === HTTP Routes ===
 
@@ -59,6 +67,79 @@ def send_data():
 def raw_data():
     return jsonify(get_data())
 
+@app.route('/api/export', methods=['GET'])
+def export_data():
+    fmt = request.args.get('format', 'ndjson').lower()
+    if fmt not in ('ndjson', 'csv'):
+        return jsonify({'error': 'format must be ndjson or csv'}), 400
+
+    try:
+        start = float(request.args['from']) if request.args.get('from') else None
+        end = float(request.args['to']) if request.args.get('to') else None
+        limit = int(request.args.get('limit', EXPORT_MAX_ROWS))
+    except ValueError:
+        return jsonify({'error': 'from/to must be UNIX timestamps, limit an integer'}), 400
+    limit = max(0, min(limit, EXPORT_MAX_ROWS))
+
+    can_id = request.args.get('id') or None
+    use_gzip = request.args.get('gzip', '').lower() in ('1', 'true', 'yes')
+
+    rows = iter_messages(can_id, start=start, end=end)
+    chunks = _export_chunks(rows, fmt, limit)
+    if use_gzip:
+        chunks = _gzip_chunks(chunks)
+
+    if fmt == 'csv':
+        mimetype, ext = 'text/csv', 'csv'
+    else:
+        mimetype, ext = 'application/x-ndjson', 'ndjson'
+    headers = {'Content-Disposition': f'attachment; filename=can_export.{ext}'}
+    if use_gzip:
+        headers['Content-Encoding'] = 'gzip'
+
+    return Response(chunks, mimetype=mimetype, headers=headers)
+
+def _export_chunks(rows, fmt, limit):
+    """Serialize (can_id, message) rows into text chunks of EXPORT_CHUNK_ROWS rows."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    if fmt == 'csv':
+        writer.writerow(EXPORT_FIELDS)
+
+    count = 0
+    for can_id, msg in rows:
+        if count >= limit:
+            break
+        if fmt == 'csv':
+            writer.writerow([
+                msg['timestamp'],
+                can_id,
+                msg['extended'],
+                ",".join(map(str, msg['payload']))
+            ])
+        else:
+            buf.write(json.dumps(dict(zip(EXPORT_FIELDS, (
+                msg['timestamp'], can_id, msg['extended'], msg['payload']
+            ))), separators=(',', ':')) + "\n")
+        count += 1
+
+        if count % EXPORT_CHUNK_ROWS == 0:
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+
+    if buf.tell():
+        yield buf.getvalue()
+
+def _gzip_chunks(chunks):
+    """Compress a stream of text chunks into a gzip stream on the fly."""
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode('utf-8'))
+        if data:
+            yield data
+    yield compressor.flush()
+
 # === CAN Message Handler ===
 
 def process_can_message(data, source="MQTT"):
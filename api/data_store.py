@@ -1,5 +1,5 @@
 from collections import defaultdict, deque
-from typing import Dict, List, Union, Optional, Any
+from typing import Dict, List, Union, Optional, Any, Iterator, Tuple
 import os
 import time
 
@@ -94,6 +94,42 @@ def get_messages_for_id(can_id: Union[str, int]) -> List[Dict[str, Any]]:
     return list(_data_store.get(normalize_can_id(can_id), []))
 
 
+def iter_messages(
+    can_id: Optional[Union[str, int]] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Lazily yield stored messages, optionally filtered by CAN ID and time range.
+
+    Only one CAN ID's history is copied at a time (bounded by MAX_HISTORY),
+    so the full store is never materialized and concurrent appends are safe.
+
+    Args:
+        can_id: Optional CAN ID to restrict the export to.
+        start: Optional inclusive lower bound on the UNIX timestamp.
+        end: Optional inclusive upper bound on the UNIX timestamp.
+    Yields:
+        Tuples of (CAN ID, message dict).
+    """
+    if can_id is not None:
+        can_ids = [normalize_can_id(can_id)]
+    else:
+        can_ids = list(_data_store.keys())
+
+    for cid in can_ids:
+        messages = _data_store.get(cid)
+        if not messages:
+            continue
+        for message in list(messages):
+            ts = message['timestamp']
+            if start is not None and ts < start:
+                continue
+            if end is not None and ts > end:
+                continue
+            yield cid, message
+
+
 def clear_all() -> None:
     """Clear all stored CAN data. Useful for resets or testing."""
     _data_store.clear()